@@ -1,10 +1,11 @@
 import tkinter as tk
 import random
+import os
 #from config.shapes import COLORS, SHAPES
 
 import json
 
-with open('config\config.json', 'r') as file:
+with open(os.path.join('config', 'config.json'), 'r') as file:
     data = json.load(file)
     COLORS = data['COLORS']
     SHAPES = data['SHAPES']
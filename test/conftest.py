@@ -0,0 +1,25 @@
+import itertools
+from types import SimpleNamespace
+
+import pytest
+from main import Tetris
+
+@pytest.fixture(scope="module")
+def canvas():
+    item_ids = itertools.count(1)
+    canvas = SimpleNamespace(configured=[])
+    canvas.create_rectangle = lambda *args, **kwargs: next(item_ids)
+    canvas.create_line = lambda *args, **kwargs: None
+    canvas.delete = lambda *args: None
+    canvas.itemconfig = lambda item, **kwargs: canvas.configured.append(item)
+    canvas.coords = lambda *args: None
+    return canvas
+
+@pytest.fixture(scope="module")
+def game(canvas):
+    return Tetris(canvas)
+
+@pytest.fixture
+def tetris(game):
+    game.reset()
+    return game
@@ -1,11 +1,120 @@
 import tkinter as tk
 import random
-import json
+import time
+from collections import deque
+from pathlib import Path
 
-with open('config/config.json', 'r') as file:
-    data = json.load(file)
-    COLORS = data['COLORS']
-    SHAPES = data['SHAPES']
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+try:
+    import numpy as np
+    import tetris_core
+except ImportError:
+    tetris_core = None
+
+data = loads(Path('config', 'config.json').read_bytes())
+COLORS = tuple(data['COLORS'])
+SHAPES = tuple(tuple(tuple(row) for row in shape) for shape in data['SHAPES'])
+
+FULL_ROW = 0x3FF
+
+def shape_to_masks(shape):
+    """
+    Converts a shape into one bitmask per row.
+
+    Bit ``x`` of a row mask is set when column ``x`` of that row is filled.
+
+    Parameters
+    ----------
+    shape : list
+        The shape of a piece as a 2D list.
+
+    Returns
+    -------
+    tuple
+        The row bitmasks of the shape.
+    """
+    return tuple(sum(cell << x for x, cell in enumerate(row)) for row in shape)
+
+def shape_bbox(row_masks):
+    """
+    Computes the bounding box of the filled cells of a shape.
+
+    Parameters
+    ----------
+    row_masks : tuple
+        The row bitmasks of the shape.
+
+    Returns
+    -------
+    tuple
+        The smallest and largest filled column and the smallest and largest
+        filled row, as ``(min_x, max_x, min_y, max_y)``.
+    """
+    rows = [y for y, mask in enumerate(row_masks) if mask]
+    filled = 0
+    for mask in row_masks:
+        filled |= mask
+    return ((filled & -filled).bit_length() - 1, filled.bit_length() - 1, rows[0], rows[-1])
+
+def rotate_shape(shape):
+    """
+    Rotates a shape clockwise.
+
+    Parameters
+    ----------
+    shape : tuple
+        The shape of a piece as a 2D tuple.
+
+    Returns
+    -------
+    tuple
+        The rotated shape as a 2D tuple.
+    """
+    return tuple(tuple(row[::-1]) for row in zip(*shape))
+
+ROTATIONS = []
+for shape in SHAPES:
+    rotations = [shape]
+    for _ in range(3):
+        rotations.append(rotate_shape(rotations[-1]))
+    ROTATIONS.append(tuple(rotations))
+ROTATIONS = tuple(ROTATIONS)
+ROTATION_MASKS = tuple(tuple(shape_to_masks(shape) for shape in rotations) for rotations in ROTATIONS)
+ROT_BBOX = tuple(tuple(shape_bbox(row_masks) for row_masks in rotations) for rotations in ROTATION_MASKS)
+ROTATION_CELLS = tuple(
+    tuple(
+        tuple((x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell)
+        for shape in rotations
+    )
+    for rotations in ROTATIONS
+)
+
+# (dx, dy) offsets tried in order when a rotation collides in place.
+WALL_KICKS = ((0, 0), (-1, 0), (1, 0), (0, -1), (-2, 0), (2, 0))
+
+piece_bag = deque()
+
+def next_piece_id():
+    """
+    Returns the index in SHAPES of the next piece to spawn.
+
+    Pieces are dealt from a shuffled bag holding every shape once, which is
+    refilled when it runs empty.
+
+    Returns
+    -------
+    int
+        The index of the shape in SHAPES.
+    """
+    if not piece_bag:
+        shape_ids = list(range(len(SHAPES)))
+        random.shuffle(shape_ids)
+        piece_bag.extend(shape_ids)
+    return piece_bag.popleft()
 
 class Tetris:
     """
@@ -18,7 +127,21 @@ class Tetris:
     score : int
         The player's score.
     game_board : list
-        The game board represented as a 2D list.
+        The game board represented as a list of 20 row bitmasks, where bit
+        ``x`` of a row is set when column ``x`` is occupied.
+    color_board : list
+        The colors of the locked cells as a 2D list, used for drawing.
+    nonempty_rows : int
+        A bitmask with bit ``y`` set when row ``y`` of the game board has a
+        locked cell.
+    cell_items : list
+        The canvas rectangle ids of the board cells as a 2D list.
+    piece_items : list
+        The canvas rectangle ids used to draw the current piece.
+    drawn_board : list
+        The colors last drawn into ``cell_items`` as a 2D list.
+    drawn_piece : tuple
+        The position, shape and color last drawn into ``piece_items``.
     current_piece : Piece
         The current piece in play.
     game_over : bool
@@ -36,25 +159,80 @@ class Tetris:
         canvas : tk.Canvas
             The canvas widget where the game is drawn.
         """
-        self.score = 0
         self.canvas = canvas
-        self.game_board = [[0] * 10 for _ in range(20)]
+        self.game_board = [0] * 20
+        self.color_board = [[0] * 10 for _ in range(20)]
+        self.create_canvas_items()
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the game to its initial state and spawns a new piece.
+
+        The board lists and canvas items are reused; the canvas catches up
+        on the next draw.
+        """
+        self.score = 0
+        for y in range(20):
+            self.game_board[y] = 0
+            self.color_board[y][:] = [0] * 10
+        self.nonempty_rows = 0
         self.current_piece = None
         self.game_over = False
         self.game_running = True
         self.spawn_new_piece()
 
+    def create_canvas_items(self):
+        """
+        Creates the canvas items used to draw the board and the current piece.
+
+        Items left by a previous game are deleted first. Drawing only
+        reconfigures these items instead of recreating them every frame.
+        """
+        self.canvas.delete("board")
+        self.cell_items = [
+            [self.canvas.create_rectangle(
+                x * 30, y * 30, (x + 1) * 30, (y + 1) * 30,
+                fill="", outline="", tags="board"
+            ) for x in range(10)]
+            for y in range(20)
+        ]
+        self.piece_items = [
+            self.canvas.create_rectangle(0, 0, 0, 0, state="hidden", outline="white", tags="board")
+            for _ in range(4)
+        ]
+        self.drawn_board = [[0] * 10 for _ in range(20)]
+        self.drawn_piece = None
+
     def spawn_new_piece(self):
         """
         Spawns a new piece at the top of the board.
         
         If the new piece collides immediately, the game is over.
+
+        Returns
+        -------
+        bool
+            True if the new piece fits, False if the game is over.
         """
         self.current_piece = Piece()
-        self.current_piece.color = random.choice(COLORS)
         if self.check_collision():
             self.game_running = False
             self.game_over = True
+        return not self.game_over
+
+    def tick(self):
+        """
+        Advances the game by one gravity step.
+
+        Returns
+        -------
+        bool
+            True if the game is still running, False otherwise.
+        """
+        if self.game_running:
+            self.move_piece_down()
+        return self.game_running
 
     def move_piece_down(self):
         """
@@ -70,9 +248,6 @@ class Tetris:
             self.lock_piece()
             self.clear_lines()
             self.spawn_new_piece()
-            if self.check_collision():
-                self.game_running = False
-                self.game_over = True 
 
     def check_collision(self):
         """
@@ -83,68 +258,177 @@ class Tetris:
         bool
             True if a collision is detected, False otherwise.
         """
-        for y, row in enumerate(self.current_piece.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = x + self.current_piece.x
-                    board_y = y + self.current_piece.y
-                    if (board_x < 0 or board_x >= 10 or 
-                        board_y < 0 or board_y >= 20 or 
-                        self.game_board[board_y][board_x]):
-                        return True
+        piece = self.current_piece
+        return self.collides(piece.row_masks, piece.bbox, piece.x, piece.y)
+
+    def collides(self, row_masks, bbox, piece_x, piece_y):
+        """
+        Checks whether a shape placed on the board collides.
+
+        Parameters
+        ----------
+        row_masks : tuple
+            The row bitmasks of the shape.
+        bbox : tuple
+            The bounding box of the shape, as returned by shape_bbox.
+        piece_x : int
+            The x-coordinate of the shape on the game board.
+        piece_y : int
+            The y-coordinate of the shape on the game board.
+
+        Returns
+        -------
+        bool
+            True if the shape leaves the board or overlaps a locked cell,
+            False otherwise.
+        """
+        min_x, max_x, min_y, max_y = bbox
+        # All four tests are cheap, so they are combined with | and branched on once.
+        if ((piece_x + min_x < 0) | (piece_x + max_x >= 10) |
+            (piece_y + min_y < 0) | (piece_y + max_y >= 20)):
+            return True
+        if not self.nonempty_rows >> (piece_y + min_y) & ((2 << (max_y - min_y)) - 1):
+            return False
+        board = self.game_board
+        for y, mask in enumerate(row_masks, piece_y):
+            if (mask << piece_x) & board[y]:
+                return True
         return False
 
+    def simulate_drop(self, row_masks, piece_x):
+        """
+        Simulates dropping a shape straight down from the top of the board.
+
+        The shape is locked and full lines are cleared on a copy of the board,
+        so the game state is not changed. The compiled kernels from
+        tetris_core are used when numba is installed.
+
+        Parameters
+        ----------
+        row_masks : tuple
+            The row bitmasks of the shape.
+        piece_x : int
+            The x-coordinate of the shape on the game board.
+
+        Returns
+        -------
+        tuple
+            The landing y-coordinate (-1 if the shape does not fit at the top),
+            the resulting board as a list of row bitmasks and the number of
+            lines cleared.
+        """
+        if tetris_core is not None:
+            landing_y, board, lines_cleared = tetris_core.simulate_drop(
+                np.array(self.game_board, dtype=np.uint16),
+                np.array(row_masks, dtype=np.uint16),
+                piece_x
+            )
+            return int(landing_y), board.tolist(), int(lines_cleared)
+
+        board = list(self.game_board)
+        bbox = shape_bbox(row_masks)
+        if self.collides(row_masks, bbox, piece_x, 0):
+            return -1, board, 0
+        landing_y = 0
+        while not self.collides(row_masks, bbox, piece_x, landing_y + 1):
+            landing_y += 1
+        for y, mask in enumerate(row_masks, landing_y):
+            board[y] |= mask << piece_x
+        kept = [row for row in board if row != FULL_ROW]
+        lines_cleared = 20 - len(kept)
+        return landing_y, [0] * lines_cleared + kept, lines_cleared
+
     def lock_piece(self):
         """
         Locks the current piece in place on the game board.
         """
-        for y, row in enumerate(self.current_piece.shape):
-            for x, cell in enumerate(row):
+        piece = self.current_piece
+        piece_x = piece.x
+        color = piece.color
+        board = self.game_board
+        color_board = self.color_board
+        nonempty_rows = self.nonempty_rows
+        for y, (row, mask) in enumerate(zip(piece.shape, piece.row_masks), piece.y):
+            board[y] |= mask << piece_x
+            nonempty_rows |= 1 << y
+            colors = color_board[y]
+            for x, cell in enumerate(row, piece_x):
                 if cell:
-                    self.game_board[y + self.current_piece.y][x + self.current_piece.x] = self.current_piece.color
+                    colors[x] = color
+        self.nonempty_rows = nonempty_rows
+
+    def update_nonempty_rows(self):
+        """
+        Recomputes nonempty_rows from the game board.
+
+        Must be called after the game board is changed other than through
+        lock_piece or clear_lines.
+        """
+        self.nonempty_rows = sum(1 << y for y, row in enumerate(self.game_board) if row)
 
     def clear_lines(self):
         """
         Clears complete lines from the game board and updates the score.
-        """
-        lines_cleared = 0
-        new_board = [row for row in self.game_board if any(cell == 0 for cell in row)]
-        lines_cleared = 20 - len(new_board)
-        new_board = [[0] * 10 for _ in range(lines_cleared)] + new_board
-        self.game_board = new_board
+
+        The remaining rows are shifted down in place, and the color rows of
+        the cleared lines are emptied and reused at the top of the board.
+        """
+        if FULL_ROW not in self.game_board:
+            return
+        board = self.game_board
+        color_board = self.color_board
+        cleared_colors = []
+        write = 19
+        for read in range(19, -1, -1):
+            row = board[read]
+            if row == FULL_ROW:
+                cleared_colors.append(color_board[read])
+            else:
+                board[write] = row
+                color_board[write] = color_board[read]
+                write -= 1
+        for y, colors in enumerate(cleared_colors):
+            board[y] = 0
+            colors[:] = (0,) * 10
+            color_board[y] = colors
+        lines_cleared = write + 1
+        self.update_nonempty_rows()
         
         self.score += lines_cleared * 30 
 
     def draw_game_board(self):
         """
         Draws the game board and the current piece on the canvas.
-        """
-        self.canvas.delete("all")
-        
-        for y in range(20):
-            self.canvas.create_line(0, y * 30, 300, y * 30, fill="wheat")
-        for x in range(10):
-            self.canvas.create_line(x * 30, 0, x * 30, 600, fill="wheat")
-
-        for y in range(len(self.game_board)):
-            for x in range(len(self.game_board[y])):
-                color = self.game_board[y][x]
-                if color:
-                    self.canvas.create_rectangle(
-                        x * 30, y * 30, (x + 1) * 30, (y + 1) * 30,
-                        fill=color, outline="white"
+
+        Only the cells whose color changed since the last draw are
+        reconfigured, and the piece items are only moved when the current
+        piece changed.
+        """
+        for y, colors in enumerate(self.color_board):
+            drawn = self.drawn_board[y]
+            if colors == drawn:
+                continue
+            for x, color in enumerate(colors):
+                if color != drawn[x]:
+                    self.canvas.itemconfig(
+                        self.cell_items[y][x],
+                        fill=color or "", outline="white" if color else ""
                     )
-        if self.current_piece:
-            for y, row in enumerate(self.current_piece.shape):
-                for x, cell in enumerate(row):
-                    if cell:
-                        self.canvas.create_rectangle(
-                            (self.current_piece.x + x) * 30,
-                            (self.current_piece.y + y) * 30,
-                            (self.current_piece.x + x + 1) * 30,
-                            (self.current_piece.y + y + 1) * 30,
-                            fill=self.current_piece.color, outline="white"
-                        )
+                    drawn[x] = color
+
+        piece = self.current_piece
+        piece_state = (piece.x, piece.y, piece.shape, piece.color) if piece else None
+        if piece_state == self.drawn_piece:
+            return
+        self.drawn_piece = piece_state
+        cells = ROTATION_CELLS[piece.rot_id][piece.rot_index] if piece else ()
+        for item, (x, y) in zip(self.piece_items, cells):
+            x += piece.x
+            y += piece.y
+            self.canvas.coords(item, x * 30, y * 30, (x + 1) * 30, (y + 1) * 30)
+            self.canvas.itemconfig(item, fill=piece.color, state="normal")
+        for item in self.piece_items[len(cells):]:
+            self.canvas.itemconfig(item, state="hidden")
 
     def move_piece_right(self):
         """
@@ -170,36 +454,44 @@ class Tetris:
         """
         Rotates the current piece clockwise.
         
-        If a collision occurs with the rotated piece, the rotation is undone.
-        """
-        rotated_shape = self.current_piece.rotate()
-        if not self.check_collision_with_rotation(rotated_shape):
-            self.current_piece.shape = rotated_shape
+        If the rotated piece collides in place, it is shifted by the offsets
+        in WALL_KICKS until one fits. If none fits, the rotation is undone.
+        """
+        piece = self.current_piece
+        rot_index = (piece.rot_index + 1) & 3
+        for dx, dy in WALL_KICKS:
+            if not self.check_collision_with_rotation(rot_index, dx, dy):
+                piece.x += dx
+                piece.y += dy
+                piece.rot_index = rot_index
+                piece.shape = ROTATIONS[piece.rot_id][rot_index]
+                piece.row_masks = ROTATION_MASKS[piece.rot_id][rot_index]
+                piece.bbox = ROT_BBOX[piece.rot_id][rot_index]
+                return
 
-    def check_collision_with_rotation(self, rotated_shape):
+    def check_collision_with_rotation(self, rot_index, dx=0, dy=0):
         """
         Checks for collisions between the rotated piece and the game board.
         
         Parameters
         ----------
-        rotated_shape : list
-            The rotated shape of the current piece.
+        rot_index : int
+            The rotation state of the current piece to check.
+        dx : int, optional
+            The horizontal offset applied to the piece.
+        dy : int, optional
+            The vertical offset applied to the piece.
         
         Returns
         -------
         bool
             True if a collision is detected, False otherwise.
         """
-        for y, row in enumerate(rotated_shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    board_x = x + self.current_piece.x
-                    board_y = y + self.current_piece.y
-                    if (board_x < 0 or board_x >= 10 or 
-                        board_y < 0 or board_y >= 20 or 
-                        self.game_board[board_y][board_x]):
-                        return True
-        return False
+        piece = self.current_piece
+        return self.collides(
+            ROTATION_MASKS[piece.rot_id][rot_index], ROT_BBOX[piece.rot_id][rot_index],
+            piece.x + dx, piece.y + dy
+        )
     
     def stop_game(self):
         """
@@ -214,8 +506,16 @@ class Piece:
     
     Attributes
     ----------
-    shape : list
-        The shape of the piece as a 2D list.
+    shape : tuple
+        The shape of the piece as a 2D tuple.
+    rot_id : int
+        The index of the piece's shape in ROTATIONS.
+    rot_index : int
+        The current rotation state of the piece, from 0 to 3.
+    row_masks : tuple
+        The shape of the piece as one bitmask per row.
+    bbox : tuple
+        The bounding box of the filled cells of the shape.
     x : int
         The x-coordinate of the piece on the game board.
     y : int
@@ -223,30 +523,40 @@ class Piece:
     color : str
         The color of the piece.
     """
+
+    __slots__ = ('shape', 'x', 'y', 'color', 'rot_id', 'rot_index', 'row_masks', 'bbox')
     
-    def __init__(self):
+    def __init__(self, shape_id=None):
         """
-        Initializes a new Tetris piece with a random shape and color.
-        """
-        self.shape = random.choice(SHAPES)
+        Initializes a new Tetris piece.
+
+        Parameters
+        ----------
+        shape_id : int, optional
+            The index of the shape in SHAPES. If omitted, the next shape from
+            the piece bag is used.
+        """
+        if shape_id is None:
+            shape_id = next_piece_id()
+        self.rot_id = shape_id
+        self.rot_index = 0
+        self.shape = ROTATIONS[self.rot_id][0]
+        self.row_masks = ROTATION_MASKS[self.rot_id][0]
+        self.bbox = ROT_BBOX[self.rot_id][0]
         self.x = 3
         self.y = 0
-        self.color = random.choice(COLORS)
+        self.color = COLORS[shape_id % len(COLORS)]
 
     def rotate(self):
         """
-        Rotates the piece clockwise.
+        Returns the shape of the piece rotated clockwise.
         
         Returns
         -------
-        list
+        tuple
             The rotated shape of the piece.
         """
-        rotated_shape = []
-        for i in range(len(self.shape[0])):
-            new_row = [self.shape[j][i] for j in range(len(self.shape))]
-            rotated_shape.append(new_row[::-1])
-        return rotated_shape
+        return ROTATIONS[self.rot_id][(self.rot_index + 1) & 3]
 
 class Application(tk.Tk):
     """
@@ -260,6 +570,12 @@ class Application(tk.Tk):
         The frame displaying the game board.
     canvas : tk.Canvas
         The canvas widget where the game is drawn.
+    grid_image : tk.PhotoImage
+        The board grid, drawn once and shown behind the board cells.
+    header_label : tk.Label
+        The label displaying the game title and statistics heading.
+    score_var : tk.StringVar
+        The text shown by the score label.
     score_label : tk.Label
         The label displaying the score.
     game_over_label : tk.Label
@@ -270,6 +586,14 @@ class Application(tk.Tk):
         The Tetris game instance.
     game_started : bool
         Indicates if the game has started.
+    redraw_pending : bool
+        Indicates if a redraw is already scheduled for when Tk is idle.
+    last_score : int
+        The score currently shown by the score label.
+    fall_interval : float
+        The number of seconds between two gravity steps.
+    next_fall : float
+        The time.monotonic() value at which the next gravity step is due.
     """
     
     def __init__(self):
@@ -291,11 +615,23 @@ class Application(tk.Tk):
         self.canvas.pack()
         self.game_frame.propagate(False)
 
+        self.grid_image = tk.PhotoImage(master=self, width=300, height=600)
+        for y in range(20):
+            self.grid_image.put("wheat", to=(0, y * 30, 300, y * 30 + 1))
+        for x in range(10):
+            self.grid_image.put("wheat", to=(x * 30, 0, x * 30 + 1, 600))
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.grid_image)
+
         self.game_frame.config(highlightbackground="burlywood", highlightthickness=2)
         
-        self.score_label = tk.Label(self.info_frame, text="TETRIS\n\n\n\nGame Statistics:\nScore: 0", font=("Arial", 20), bd=0, relief="flat", fg='#a36940')
+        self.header_label = tk.Label(self.info_frame, text="TETRIS\n\n\n\nGame Statistics:", font=("Arial", 20), bd=0, relief="flat", fg='#a36940')
+        self.header_label.configure(bg="blanchedalmond")
+        self.header_label.pack(pady=(20, 0))
+
+        self.score_var = tk.StringVar(self, value="Score: 0")
+        self.score_label = tk.Label(self.info_frame, textvariable=self.score_var, font=("Arial", 20), bd=0, relief="flat", fg='#a36940')
         self.score_label.configure(bg="blanchedalmond")
-        self.score_label.pack(pady=20)
+        self.score_label.pack(pady=(0, 20))
         
         self.game_over_label = tk.Label(self.info_frame, text="", font=("Arial", 20), bg="blanchedalmond", fg="red")
         self.game_over_label.pack(pady=20)
@@ -306,6 +642,10 @@ class Application(tk.Tk):
         self.tetris = Tetris(self.canvas)
         self.bind("<KeyPress>", self.on_key_press)
         self.game_started = False
+        self.redraw_pending = False
+        self.last_score = 0
+        self.fall_interval = 0.6
+        self.next_fall = 0.0
 
     def process_events(self):
         """
@@ -343,8 +683,25 @@ class Application(tk.Tk):
                 elif event.keysym == "Up":
                     self.tetris.rotate_piece()
 
-                self.tetris.draw_game_board()
-                self.update_score_label()
+                self.request_redraw()
+
+    def request_redraw(self):
+        """
+        Schedules a redraw for when Tk is idle.
+
+        Several requests made before the redraw runs result in a single redraw.
+        """
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self.flush_redraw)
+
+    def flush_redraw(self):
+        """
+        Draws the game board and updates the score label.
+        """
+        self.redraw_pending = False
+        self.tetris.draw_game_board()
+        self.update_score_label()
 
     def start_game(self):
         """
@@ -352,13 +709,14 @@ class Application(tk.Tk):
         """
         self.game_started = True
         self.start_label.config(text="")
+        self.next_fall = time.monotonic()
         self.update_game()
 
     def restart_game(self):
         """
-        Restarts the game by creating a new Tetris instance and starting the game.
+        Restarts the game by resetting the Tetris instance and starting the game.
         """
-        self.tetris = Tetris(self.canvas)
+        self.tetris.reset()
         self.game_over_label.config(text="")
         self.start_game()
 
@@ -372,19 +730,29 @@ class Application(tk.Tk):
     def update_game(self):
         """
         Updates the game state by moving the piece down, drawing the game board, and scheduling the next update.
+
+        Every gravity step that fell due since the last update is applied, so
+        the fall rate follows the clock even when updates run late.
         """
         if self.tetris.game_running:
-            self.tetris.move_piece_down()
-            self.tetris.draw_game_board()
-            self.after(600, self.update_game)
+            now = time.monotonic()
+            while self.next_fall <= now and self.tetris.tick():
+                self.next_fall += self.fall_interval
+            self.request_redraw()
+            self.after(max(1, int((self.next_fall - now) * 1000)), self.update_game)
         else:
             self.display_game_over()
 
     def update_score_label(self):
         """
         Updates the score label with the current score.
+
+        The label is left untouched if the score has not changed.
         """
-        self.score_label.config(text="TETRIS\n\n\n\nGame Statistics:\nScore: {}".format(self.tetris.score))
+        score = self.tetris.score
+        if score != self.last_score:
+            self.score_var.set("Score: {}".format(score))
+            self.last_score = score
 
     def display_game_over(self):
         """
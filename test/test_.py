@@ -1,64 +1,195 @@
 import pytest
-from main import Tetris, Piece
+import main
+from main import Tetris, Piece, FULL_ROW, ROTATIONS, ROTATION_MASKS, ROT_BBOX, SHAPES, COLORS, next_piece_id, shape_bbox
 import tkinter as tk
 
 """
-Кожен тест починається з фіктивної області MockCanvas, яка створюється для того, 
-щоб імітувати клас Canvas з бібліотеки Tkinter. Потім визначаються фіктивні фікстури canvas і tetris,
-які використовуються для передачі MockCanvas та об'єкта Tetris в кожен тест відповідно.
+Фікстури canvas і tetris визначені у conftest.py: фіктивне полотно, що імітує клас Canvas
+з бібліотеки Tkinter, створюється один раз на модуль, а спільний об'єкт Tetris
+скидається методом reset() перед кожним тестом.
 """
 
-class MockCanvas:
-    def create_rectangle(self, *args, **kwargs):
-        pass
-
-    def create_line(self, *args, **kwargs):
-        pass
-
-    def delete(self, *args):
-        pass
-
-@pytest.fixture
-def canvas():
-    return MockCanvas()
-
-@pytest.fixture
-def tetris(canvas):
-    return Tetris(canvas)
-
 def test_tetris_initialization(tetris, canvas):
     assert tetris.score == 0
     assert tetris.canvas == canvas
     assert len(tetris.game_board) == 20
-    assert all(len(row) == 10 for row in tetris.game_board)
+    assert all(row == 0 for row in tetris.game_board)
+    assert len(tetris.color_board) == 20
+    assert all(len(row) == 10 for row in tetris.color_board)
     assert tetris.current_piece is not None
     assert not tetris.game_over
     assert tetris.game_running
 
+def test_reset(tetris):
+    game_board = tetris.game_board
+    tetris.game_board[19] = FULL_ROW
+    tetris.color_board[19][0] = "red"
+    tetris.score = 90
+    tetris.stop_game()
+    tetris.reset()
+    assert tetris.game_board is game_board
+    assert all(row == 0 for row in tetris.game_board)
+    assert tetris.color_board[19][0] == 0
+    assert tetris.score == 0
+    assert tetris.game_running and not tetris.game_over
+
 def test_spawn_new_piece(tetris):
-    tetris.spawn_new_piece()
+    assert tetris.spawn_new_piece()
     assert tetris.current_piece is not None
 
+def test_spawn_new_piece_game_over(tetris):
+    tetris.game_board[0] = tetris.game_board[1] = FULL_ROW
+    tetris.update_nonempty_rows()
+    assert not tetris.spawn_new_piece()
+    assert tetris.game_over
+    assert not tetris.game_running
+
+def test_config_is_frozen():
+    assert isinstance(COLORS, tuple)
+    assert all(isinstance(row, tuple) for shape in SHAPES for row in shape)
+
+def test_next_piece_id_deals_every_shape_per_bag():
+    main.piece_bag.clear()
+    for _ in range(3):
+        assert sorted(next_piece_id() for _ in SHAPES) == list(range(len(SHAPES)))
+
+def test_piece_has_no_instance_dict():
+    piece = Piece(0)
+    assert not hasattr(piece, "__dict__")
+    with pytest.raises(AttributeError):
+        piece.speed = 1
+
+def test_piece_color_follows_shape():
+    for shape_id in range(len(SHAPES)):
+        piece = Piece(shape_id)
+        assert piece.shape == ROTATIONS[shape_id][0]
+        assert piece.color == COLORS[shape_id % len(COLORS)]
+
 def test_move_piece_down(tetris):
     initial_y = tetris.current_piece.y
     tetris.move_piece_down()
     assert tetris.current_piece.y == initial_y + 1
 
+def test_tick(tetris):
+    initial_y = tetris.current_piece.y
+    assert tetris.tick()
+    assert tetris.current_piece.y == initial_y + 1
+    tetris.stop_game()
+    assert not tetris.tick()
+    assert tetris.current_piece.y == initial_y + 1
+
 def test_check_collision_with_bottom(tetris):
-    tetris.current_piece.y = 19
+    tetris.current_piece.y = 21 - len(tetris.current_piece.shape)
+    assert tetris.check_collision() == True
+
+def test_check_collision_with_locked_cells(tetris):
+    tetris.game_board[tetris.current_piece.y] = FULL_ROW
+    tetris.update_nonempty_rows()
     assert tetris.check_collision() == True
+    tetris.game_board[tetris.current_piece.y] = 0
+    tetris.update_nonempty_rows()
+    assert tetris.check_collision() == False
+
+def test_collides_with_walls(tetris):
+    for row_masks, x, y, expected in [
+        ((0b1,), 9, 0, False),
+        ((0b11,), 9, 0, True),
+        ((0b1,), -1, 0, True),
+        ((0b1, 0b1), 0, 19, True),
+    ]:
+        assert tetris.collides(row_masks, shape_bbox(row_masks), x, y) == expected
+
+def test_shape_bbox():
+    assert shape_bbox((0b011, 0b110)) == (0, 2, 0, 1)
+    assert shape_bbox((0b100, 0b100)) == (2, 2, 0, 1)
+    for shape_id, rotations in enumerate(ROTATIONS):
+        for rot_index, shape in enumerate(rotations):
+            assert ROT_BBOX[shape_id][rot_index] == (0, len(shape[0]) - 1, 0, len(shape) - 1)
+
+def test_simulate_drop(tetris):
+    tetris.game_board[19] = FULL_ROW ^ 0b11
+    tetris.update_nonempty_rows()
+    landing_y, board, lines_cleared = tetris.simulate_drop((0b11, 0b11), 0)
+    assert landing_y == 18
+    assert lines_cleared == 1
+    assert board[19] == 0b11
+    assert all(row == 0 for row in board[:19])
+    assert tetris.game_board[19] == FULL_ROW ^ 0b11
+
+def test_simulate_drop_python_fallback(tetris, monkeypatch):
+    monkeypatch.setattr(main, "tetris_core", None)
+    tetris.game_board[19] = FULL_ROW ^ 0b11
+    tetris.update_nonempty_rows()
+    assert tetris.simulate_drop((0b11, 0b11), 0) == (18, [0] * 19 + [0b11], 1)
+    assert tetris.simulate_drop((0b11, 0b11), 9)[0] == -1
+    assert tetris.simulate_drop((0b1, 0b1), 0)[0] == 18
+    assert tetris.simulate_drop((0b100,), 0) == (18, [0] * 18 + [0b100, FULL_ROW ^ 0b11], 0)
+
+def test_tetris_core_matches_python(tetris, monkeypatch):
+    pytest.importorskip("numba")
+    tetris.game_board[17:] = [0b1, FULL_ROW ^ 0b1000, FULL_ROW ^ 0b1100]
+    tetris.update_nonempty_rows()
+    compiled = [tetris.simulate_drop(masks, x) for masks in ROTATION_MASKS[1] for x in range(-1, 10)]
+    monkeypatch.setattr(main, "tetris_core", None)
+    python = [tetris.simulate_drop(masks, x) for masks in ROTATION_MASKS[1] for x in range(-1, 10)]
+    assert compiled == python
 
 def test_lock_piece(tetris):
     tetris.current_piece.x = 0
     tetris.current_piece.y = 0
     tetris.lock_piece()
-    assert tetris.game_board[0][0] == tetris.current_piece.color
+    for y, row in enumerate(tetris.current_piece.shape):
+        for x, cell in enumerate(row):
+            assert bool(tetris.game_board[y] >> x & 1) == bool(cell)
+            assert (tetris.color_board[y][x] == tetris.current_piece.color) == bool(cell)
+
+def test_lock_piece_marks_nonempty_rows(tetris):
+    piece = tetris.current_piece
+    piece.y = 20 - len(piece.shape)
+    tetris.lock_piece()
+    assert tetris.nonempty_rows == sum(1 << y for y in range(piece.y, 20))
+    tetris.game_board[piece.y:] = [FULL_ROW] * len(piece.shape)
+    tetris.clear_lines()
+    assert tetris.nonempty_rows == 0
 
 def test_clear_lines(tetris):
-    tetris.game_board[19] = [1] * 10  # Заповнюємо останню лінію
+    tetris.game_board[19] = FULL_ROW  # Заповнюємо останню лінію
+    tetris.color_board[19] = ["red"] * 10
     tetris.clear_lines()
     assert tetris.score == 30
-    assert all(cell == 0 for cell in tetris.game_board[19])
+    assert tetris.game_board[19] == 0
+    assert all(cell == 0 for cell in tetris.color_board[19])
+
+def test_clear_lines_keeps_partial_rows(tetris):
+    game_board = tetris.game_board
+    tetris.game_board[17] = FULL_ROW
+    tetris.game_board[18] = 0b1
+    tetris.color_board[18][0] = "red"
+    tetris.game_board[19] = FULL_ROW
+    tetris.clear_lines()
+    assert tetris.score == 60
+    assert tetris.game_board[18:] == [0, 0b1]
+    assert tetris.color_board[19][0] == "red"
+    assert len({id(colors) for colors in tetris.color_board}) == 20
+    assert all(row == 0 for row in tetris.game_board[:18])
+    assert tetris.game_board is game_board
+
+def test_draw_game_board_updates_changed_cells(tetris, canvas):
+    tetris.draw_game_board()
+    canvas.configured.clear()
+    tetris.color_board[19][0] = "red"
+    tetris.draw_game_board()
+    assert tetris.drawn_board[19][0] == "red"
+    assert len(canvas.configured) == 1
+
+def test_draw_game_board_moves_piece_only_when_changed(tetris, canvas):
+    tetris.draw_game_board()
+    canvas.configured.clear()
+    tetris.draw_game_board()
+    assert canvas.configured == []
+    tetris.move_piece_down()
+    tetris.draw_game_board()
+    assert canvas.configured == tetris.piece_items
 
 def test_rotate_piece():
     piece = Piece()
@@ -67,6 +198,27 @@ def test_rotate_piece():
     assert len(original_shape) == len(rotated_shape[0])
     assert len(original_shape[0]) == len(rotated_shape)
 
+def test_rotations_cycle():
+    for shape_id, rotations in enumerate(ROTATIONS):
+        assert len(rotations) == 4
+        piece = Piece(shape_id)
+        for _ in range(4):
+            piece.shape = piece.rotate()
+            piece.rot_index = (piece.rot_index + 1) & 3
+        assert piece.shape == rotations[0]
+
+def test_rotate_piece_wall_kick(tetris):
+    piece = tetris.current_piece
+    piece.rot_id, piece.rot_index = 0, 1
+    piece.shape = ROTATIONS[0][1]
+    piece.row_masks = ROTATION_MASKS[0][1]
+    piece.bbox = ROT_BBOX[0][1]
+    piece.x, piece.y = 8, 5
+    tetris.rotate_piece()
+    assert piece.rot_index == 2
+    assert piece.x == 6
+    assert not tetris.check_collision()
+
 def test_stop_game(tetris):
     tetris.stop_game()
     assert tetris.game_over
@@ -0,0 +1,122 @@
+"""
+Compiled kernels for simulating piece drops on a bitmask board.
+
+A board is a ``numpy.uint16`` array of 20 row bitmasks and a shape is a
+``numpy.uint16`` array with one bitmask per row, in the same layout as
+``Tetris.game_board`` and ``Piece.row_masks``. This module needs numpy and
+numba; ``main`` falls back to pure Python when they are not installed.
+"""
+import numpy as np
+from numba import njit
+
+FULL_ROW = 0x3FF
+
+@njit(cache=True)
+def collides(board, masks, x, y):
+    """
+    Checks whether a shape placed on the board collides.
+
+    Parameters
+    ----------
+    board : numpy.ndarray
+        The row bitmasks of the board.
+    masks : numpy.ndarray
+        The row bitmasks of the shape.
+    x : int
+        The x-coordinate of the shape on the board.
+    y : int
+        The y-coordinate of the shape on the board.
+
+    Returns
+    -------
+    bool
+        True if the shape leaves the board or overlaps a locked cell,
+        False otherwise.
+    """
+    if x < 0 or y < 0 or y + masks.shape[0] > board.shape[0]:
+        return True
+    for dy in range(masks.shape[0]):
+        mask = np.int64(masks[dy]) << x
+        if mask > FULL_ROW or mask & board[y + dy]:
+            return True
+    return False
+
+@njit(cache=True)
+def drop(board, masks, x):
+    """
+    Finds the row where a shape dropped from the top of the board comes to rest.
+
+    Parameters
+    ----------
+    board : numpy.ndarray
+        The row bitmasks of the board.
+    masks : numpy.ndarray
+        The row bitmasks of the shape.
+    x : int
+        The x-coordinate of the shape on the board.
+
+    Returns
+    -------
+    int
+        The landing y-coordinate, or -1 if the shape does not fit at the top.
+    """
+    if collides(board, masks, x, 0):
+        return -1
+    y = 0
+    while not collides(board, masks, x, y + 1):
+        y += 1
+    return y
+
+@njit(cache=True)
+def clear(board):
+    """
+    Removes the full rows of a board in place.
+
+    Parameters
+    ----------
+    board : numpy.ndarray
+        The row bitmasks of the board.
+
+    Returns
+    -------
+    int
+        The number of rows cleared.
+    """
+    write = board.shape[0] - 1
+    for read in range(board.shape[0] - 1, -1, -1):
+        if board[read] != FULL_ROW:
+            board[write] = board[read]
+            write -= 1
+    for y in range(write + 1):
+        board[y] = 0
+    return write + 1
+
+@njit(cache=True)
+def simulate_drop(board, masks, x):
+    """
+    Drops a shape from the top of the board, locks it and clears full rows.
+
+    The given board is left unchanged.
+
+    Parameters
+    ----------
+    board : numpy.ndarray
+        The row bitmasks of the board.
+    masks : numpy.ndarray
+        The row bitmasks of the shape.
+    x : int
+        The x-coordinate of the shape on the board.
+
+    Returns
+    -------
+    tuple
+        The landing y-coordinate (-1 if the shape does not fit at the top),
+        the resulting board and the number of rows cleared.
+    """
+    new_board = board.copy()
+    y = drop(board, masks, x)
+    if y < 0:
+        return y, new_board, 0
+    for dy in range(masks.shape[0]):
+        new_board[y + dy] |= np.uint16(np.int64(masks[dy]) << x)
+    return y, new_board, clear(new_board)